@@ -501,6 +501,9 @@ class DataFlowKernel(object):
             exec_fu = executor.submit(executable, self.tasks[task_id]['resource_specification'], *args, **kwargs)
         self.tasks[task_id]['status'] = States.launched
 
+        # New work may need new blocks, so stop any idle back-off of the strategy timer
+        self.flowcontrol.reset_interval()
+
         self._send_task_log_info(self.tasks[task_id])
 
         logger.info("Task {} launched on executor {}".format(task_id, executor.label))
@@ -33,6 +33,15 @@ class FlowControl(object):
     of ``interval`` for systems with infrequent events as well as systems which would
     generate large bursts of events.
 
+    When a callback reports that no scaling action was taken or pending, the delay before
+    the next callback is multiplied by ``backoff``, up to ``max_interval``, so that
+    an idle or steady-state workflow does not keep polling providers for status.
+    The delay drops back to ``interval`` as soon as a scaling action is taken or
+    :meth:`reset_interval` is called, which the DFK does whenever a task is launched.
+    The callback also runs the :class:`~parsl.dataflow.job_error_handler.JobErrorHandler`,
+    so while backed off, failed blocks can take up to ``max_interval`` seconds to be
+    detected rather than ``interval``.
+
     Once a callback is triggered, the callback generally runs a strategy
     method on the sites available as well asqeuque
 
@@ -42,7 +51,7 @@ class FlowControl(object):
     from a duplicate logger being added by the thread.
     """
 
-    def __init__(self, dfk, *args, threshold=20, interval=5):
+    def __init__(self, dfk, *args, threshold=20, interval=5, max_interval=60, backoff=1.5):
         """Initialize the flowcontrol object.
 
         We start the timer thread here
@@ -53,10 +62,17 @@ class FlowControl(object):
         KWargs:
              - threshold (int) : Tasks after which the callback is triggered
              - interval (int) : seconds after which timer expires
+             - max_interval (int) : upper bound in seconds on the backed-off timer interval
+             - backoff (float) : factor by which the interval grows after a callback that took no action
         """
         self.dfk = dfk
         self.threshold = threshold
         self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.backoff = backoff
+        self._current_interval = interval
+        self._interval_lock = threading.Lock()
+        self._reset_count = 0
         self.cb_args = args
         self.task_status_poller = TaskStatusPoller(dfk)
         self.callback = self.task_status_poller.poll
@@ -81,16 +97,16 @@ class FlowControl(object):
             prev = self._wake_up_time
 
             # Waiting for the event returns True only when the event
-            # is set, usually by the parent thread
-            time_to_die = kill_event.wait(float(max(prev - time.time(), 0)))
+            # is set, usually by the parent thread.
+            # Never sleep for longer than the base interval, so that
+            # a reset_interval() during a long back-off is noticed promptly.
+            time_to_die = kill_event.wait(float(min(max(prev - time.time(), 0), self.interval)))
 
             if time_to_die:
                 return
 
-            if prev == self._wake_up_time:
+            if prev == self._wake_up_time and time.time() >= prev:
                 self.make_callback(kind='timer')
-            else:
-                print("Sleeping a bit more")
 
     def notify(self, event_id):
         """Let the FlowControl system know that there is an event."""
@@ -107,13 +123,40 @@ class FlowControl(object):
                - kind (str): Default=None, used to pass information on what
                  triggered the callback
         """
-        self._wake_up_time = time.time() + self.interval
+        start = time.time()
+        with self._interval_lock:
+            reset_count = self._reset_count
+            self._wake_up_time = start + self._current_interval
         try:
-            self.callback(tasks=self._event_buffer, kind=kind)
+            scaling_active = self.callback(tasks=self._event_buffer, kind=kind)
         except Exception:
             logger.error("Flow control callback threw an exception - logging and proceeding anyway", exc_info=True)
+            scaling_active = True
         self._event_buffer = []
 
+        with self._interval_lock:
+            # A reset_interval() while the callback ran means a task arrived
+            # that the callback may not have seen, so do not back off past it
+            if scaling_active or self._reset_count != reset_count:
+                self._current_interval = self.interval
+            else:
+                self._current_interval = min(self._current_interval * self.backoff, self.max_interval)
+            self._wake_up_time = start + self._current_interval
+
+    def reset_interval(self):
+        """Drop the timer interval back to its base value after a back-off.
+
+        This only takes an uncontended lock when no back-off is in effect, so
+        it can be called on every task launch.
+        """
+        with self._interval_lock:
+            self._reset_count += 1
+            if self._current_interval == self.interval:
+                return
+            self._current_interval = self.interval
+            self._wake_up_time = min(self._wake_up_time, time.time() + self.interval)
+            logger.debug("Flow control interval reset to {}s".format(self.interval))
+
     def add_executors(self, executors):
         self.task_status_poller.add_executors(executors)
 
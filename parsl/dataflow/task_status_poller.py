@@ -6,7 +6,7 @@ from typing import List  # noqa F401 (used in type annotation)
 
 from parsl.dataflow.executor_status import ExecutorStatus
 from parsl.dataflow.job_error_handler import JobErrorHandler
-from parsl.dataflow.strategy import Strategy
+from parsl.dataflow.strategy import Strategy, map_blocking_calls
 from parsl.executors.base import ParslExecutor
 from parsl.providers.provider_base import JobStatus, JobState
 
@@ -63,12 +63,12 @@ class TaskStatusPoller(object):
     def poll(self, tasks=None, kind=None):
         self._update_state()
         self._error_handler.run(self._poll_items)
-        self._strategy.strategize(self._poll_items, tasks)
+        return self._strategy.strategize(self._poll_items, tasks)
 
     def _update_state(self):
         now = time.time()
-        for item in self._poll_items:
-            item.poll(now)
+        due = [item for item in self._poll_items if item._should_poll(now)]
+        map_blocking_calls(lambda item: item.poll(now), due)
 
     def add_executors(self, executors: Sequence[ParslExecutor]):
         for executor in executors:
@@ -163,6 +163,11 @@ class ExtremeScaleExecutor(HighThroughputExecutor, RepresentationMixin):
                                "--hb_threshold={heartbeat_threshold} ")
         self.worker_debug = worker_debug
 
+    @property
+    def tasks_per_node(self):
+        """Number of tasks that can run at once on each node: one per MPI rank."""
+        return self.ranks_per_node
+
     def start(self):
         if not _mpi_enabled:
             raise OptionalModuleMissing("mpi4py", "Cannot initialize ExtremeScaleExecutor without mpi4py")
@@ -488,8 +488,18 @@ class HighThroughputExecutor(StatusHandlingExecutor, RepresentationMixin):
 
     @property
     def outstanding(self):
-        outstanding_c = self.command_client.run("OUTSTANDING_C")
-        return outstanding_c
+        """Number of submitted tasks whose result or exception has not yet come back.
+
+        submit() adds each task's future to self.tasks and the queue management
+        thread pops it when the result arrives, so this is read locally
+        without a command round trip to the interchange.
+
+        Once the executor is in a bad state that thread has exited and every
+        remaining future has been failed, so nothing is outstanding.
+        """
+        if self.bad_state_is_set:
+            return 0
+        return len(self.tasks)
 
     @property
     def connected_workers(self):
@@ -501,6 +511,11 @@ class HighThroughputExecutor(StatusHandlingExecutor, RepresentationMixin):
         workers = self.command_client.run("MANAGERS")
         return workers
 
+    @property
+    def tasks_per_node(self):
+        """Number of tasks that can run at once on each node: one per worker."""
+        return self.workers_per_node
+
     def _hold_block(self, block_id):
         """ Sends hold command to all managers which are in a specific block
 
@@ -552,8 +567,6 @@ class HighThroughputExecutor(StatusHandlingExecutor, RepresentationMixin):
             args_to_print = tuple([arg if len(repr(arg)) < 100 else (repr(arg)[:100] + '...') for arg in args])
         logger.debug("Pushing function {} to queue with args {}".format(func, args_to_print))
 
-        self.tasks[task_id] = Future()
-
         try:
             fn_buf = pack_apply_message(func, args, kwargs,
                                         buffer_threshold=1024 * 1024)
@@ -563,11 +576,20 @@ class HighThroughputExecutor(StatusHandlingExecutor, RepresentationMixin):
         msg = {"task_id": task_id,
                "buffer": fn_buf}
 
-        # Post task to the the outgoing queue
-        self.outgoing_q.put(msg)
+        # Register the future before posting, so that the queue management
+        # thread can always find it, but drop it again if the task never
+        # reaches the queue, as outstanding counts every registered future
+        fut = Future()
+        self.tasks[task_id] = fut
+        try:
+            # Post task to the the outgoing queue
+            self.outgoing_q.put(msg)
+        except Exception:
+            self.tasks.pop(task_id, None)
+            raise
 
         # Return the future
-        return self.tasks[task_id]
+        return fut
 
     @property
     def scaling_enabled(self):
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from parsl.config import Config
+from parsl.dataflow.flow_control import FlowControl
+
+
+class FakeDFK(object):
+    def __init__(self, config):
+        self.config = config
+        self.executors = {e.label: e for e in config.executors}
+
+
+def make_flowcontrol(callback, interval=5, max_interval=20, backoff=2):
+    fc = FlowControl(FakeDFK(Config()), interval=interval, max_interval=max_interval, backoff=backoff)
+    # Stop the timer thread so that only the calls made by the test run the callback
+    fc.close()
+    fc.callback = callback
+    return fc
+
+
+@pytest.mark.local
+def test_interval_grows_up_to_max_interval():
+    fc = make_flowcontrol(lambda tasks, kind: False)
+
+    intervals = []
+    for i in range(4):
+        fc.make_callback()
+        intervals.append(fc._current_interval)
+    assert intervals == [10, 20, 20, 20]
+
+
+@pytest.mark.local
+def test_scaling_action_resets_interval():
+    results = [False, False, True]
+    fc = make_flowcontrol(lambda tasks, kind: results.pop(0))
+
+    fc.make_callback()
+    fc.make_callback()
+    assert fc._current_interval == 20
+    fc.make_callback()
+    assert fc._current_interval == 5
+
+
+@pytest.mark.local
+def test_callback_exception_resets_interval():
+    def callback(tasks, kind):
+        if fc._current_interval == 10:
+            raise RuntimeError("poll failed")
+        return False
+
+    fc = make_flowcontrol(callback)
+
+    fc.make_callback()
+    assert fc._current_interval == 10
+    fc.make_callback()
+    assert fc._current_interval == 5
+
+
+@pytest.mark.local
+def test_reset_interval_pulls_wake_up_time_earlier():
+    fc = make_flowcontrol(lambda tasks, kind: False)
+    fc.make_callback()
+    fc.make_callback()
+    assert fc._wake_up_time > time.time() + 15
+
+    fc.reset_interval()
+    assert fc._current_interval == 5
+    assert fc._wake_up_time <= time.time() + 5
+
+
+@pytest.mark.local
+def test_reset_during_callback_is_not_lost():
+    def callback(tasks, kind):
+        # A task launched while the strategy is running
+        fc.reset_interval()
+        return False
+
+    fc = make_flowcontrol(callback)
+    fc._current_interval = 20
+
+    fc.make_callback()
+    assert fc._current_interval == 5
+    assert fc._wake_up_time <= time.time() + 5
@@ -5,7 +5,6 @@ from parsl import python_app
 
 from parsl.providers import LocalProvider
 from parsl.channels import LocalChannel
-# from parsl.launchers import SimpleLauncher
 from parsl.launchers import SingleNodeLauncher
 
 from parsl.config import Config
@@ -0,0 +1,195 @@
+import logging
+from concurrent.futures import Future
+
+import pytest
+
+from parsl.config import Config
+from parsl.dataflow.strategy import Strategy
+from parsl.executors import ExtremeScaleExecutor, HighThroughputExecutor
+from parsl.executors.errors import SerializationError
+from parsl.providers import LocalProvider
+from parsl.providers.provider_base import JobState, JobStatus
+
+
+class FakeDFK(object):
+    def __init__(self, config):
+        self.config = config
+        self.executors = {e.label: e for e in config.executors}
+
+
+class FakeCommandClient(object):
+    def run(self, message):
+        return 0
+
+
+class FakeClock(object):
+    """Stands in for the time module inside parsl.dataflow.strategy only."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+
+def make_strategy(min_blocks=0, max_blocks=4, parallelism=1, max_idletime=60):
+    executor = HighThroughputExecutor(
+        label='htex_strategy',
+        address='127.0.0.1',
+        max_workers=2,
+        provider=LocalProvider(
+            init_blocks=0,
+            min_blocks=min_blocks,
+            max_blocks=max_blocks,
+            parallelism=parallelism,
+        ),
+    )
+    config = Config(executors=[executor], strategy='simple', max_idletime=max_idletime)
+    return Strategy(FakeDFK(config)), executor
+
+
+def blocks(running=0, pending=0):
+    status = {}
+    for i in range(running):
+        status['r{}'.format(i)] = JobStatus(JobState.RUNNING)
+    for i in range(pending):
+        status['p{}'.format(i)] = JobStatus(JobState.PENDING)
+    return status
+
+
+@pytest.mark.local
+def test_scale_out_to_cover_tasks():
+    strategy, executor = make_strategy()
+
+    # 2 slots per block, 1 block pending and 7 tasks: 5 tasks need 3 more blocks
+    assert strategy._decide(executor, blocks(pending=1), 7, False) == ('scale_out', 3, {})
+
+
+@pytest.mark.local
+def test_scale_out_capped_by_max_blocks():
+    strategy, executor = make_strategy(max_blocks=2)
+
+    assert strategy._decide(executor, blocks(running=1), 100, False) == ('scale_out', 1, {})
+    assert strategy._decide(executor, blocks(running=2), 100, False)[0] == 'noop'
+
+
+@pytest.mark.local
+def test_scale_in_after_idle_time(monkeypatch):
+    strategy, executor = make_strategy(min_blocks=1, max_idletime=10)
+    clock = FakeClock()
+    monkeypatch.setattr('parsl.dataflow.strategy.time', clock)
+
+    assert strategy._decide(executor, blocks(running=3), 0, False)[0] == 'wait'
+    clock.now += 5
+    assert strategy._decide(executor, blocks(running=3), 0, False)[0] == 'wait'
+    clock.now += 6
+    assert strategy._decide(executor, blocks(running=3), 0, False) == ('scale_in', 2, {})
+
+
+@pytest.mark.local
+def test_active_tasks_reset_idle_timer(monkeypatch):
+    strategy, executor = make_strategy(max_idletime=10)
+    clock = FakeClock()
+    monkeypatch.setattr('parsl.dataflow.strategy.time', clock)
+
+    assert strategy._decide(executor, blocks(running=1), 0, False)[0] == 'wait'
+    clock.now += 8
+    strategy._decide(executor, blocks(running=1), 2, False)
+    clock.now += 8
+    assert strategy._decide(executor, blocks(running=1), 0, False)[0] == 'wait'
+
+
+@pytest.mark.local
+def test_excess_slots_only_scale_in_for_htex_auto_scale():
+    strategy, executor = make_strategy()
+    assert strategy._decide(executor, blocks(running=2), 1, False)[0] == 'noop'
+
+    strategy, executor = make_strategy()
+    action, n, kwargs = strategy._decide(executor, blocks(running=2), 1, True)
+    assert (action, n) == ('scale_in', 1)
+    assert kwargs['force'] is False
+
+
+@pytest.mark.local
+def test_unchanged_state_skips_decision_ladder(caplog):
+    strategy, executor = make_strategy()
+    # connected_workers is only asked for when debug logging is enabled
+    executor.command_client = FakeCommandClient()
+
+    with caplog.at_level(logging.DEBUG, logger='parsl.dataflow.strategy'):
+        assert strategy._decide(executor, blocks(running=2), 3, False)[0] == 'noop'
+        assert len(caplog.records) > 0
+        caplog.clear()
+
+        assert strategy._decide(executor, blocks(running=2), 3, False)[0] == 'noop'
+        assert caplog.records == []
+
+
+@pytest.mark.local
+def test_scaling_action_clears_fingerprint():
+    strategy, executor = make_strategy()
+
+    # The scale out has not shown up in the block status yet, so an unchanged
+    # status must be decided on again rather than skipped
+    assert strategy._decide(executor, blocks(), 2, False) == ('scale_out', 1, {})
+    assert strategy.executors[executor.label].last_fingerprint is None
+    assert strategy._decide(executor, blocks(), 2, False) == ('scale_out', 1, {})
+
+
+@pytest.mark.local
+def test_htex_outstanding_counts_unfinished_tasks():
+    strategy, executor = make_strategy()
+    executor.tasks[0] = Future()
+    executor.tasks[1] = Future()
+    assert executor.outstanding == 2
+
+    # The queue management thread stops popping futures once the executor is bad,
+    # so the failed futures left in executor.tasks must not cause a scale out
+    executor.set_bad_state_and_fail_all(Exception("block failed"))
+    assert executor.outstanding == 0
+    assert strategy._decide(executor, blocks(), executor.outstanding, False)[0] == 'noop'
+
+
+def double(x):
+    return 2 * x
+
+
+@pytest.mark.local
+def test_htex_outstanding_ignores_tasks_that_failed_to_submit():
+    strategy, executor = make_strategy()
+
+    # Generators cannot be pickled, so the task never reaches the interchange
+    with pytest.raises(SerializationError):
+        executor.submit(double, None, (i for i in range(3)))
+    assert executor.outstanding == 0
+
+
+class StubExecutor(object):
+    scaling_enabled = True
+
+    def __init__(self, label, tasks_per_node=None, provider=None):
+        self.label = label
+        self.tasks_per_node = tasks_per_node
+        self.provider = provider
+
+
+@pytest.mark.local
+def test_executor_without_scaling_limits_is_not_scaled():
+    strategy, executor = make_strategy()
+    strategy.add_executors([StubExecutor('unscalable'),
+                            StubExecutor('no_tasks_per_node', provider=LocalProvider()),
+                            StubExecutor('scalable', tasks_per_node=2, provider=LocalProvider())])
+
+    assert strategy._scaling_enabled_labels == {'scalable'}
+
+
+@pytest.mark.local
+def test_exex_blocks_are_sized_by_ranks_per_node():
+    strategy, executor = make_strategy()
+    exex = ExtremeScaleExecutor(label='exex_strategy', ranks_per_node=4,
+                                provider=LocalProvider(nodes_per_block=2))
+    strategy.add_executors([exex])
+
+    # ExtremeScaleExecutor is a HighThroughputExecutor, but runs one task per MPI rank
+    assert strategy.executors['exex_strategy'].slots_per_block == 8
+    assert strategy.executors[executor.label].slots_per_block == 2
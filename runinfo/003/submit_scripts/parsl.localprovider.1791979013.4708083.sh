@@ -0,0 +1,3 @@
+
+export JOBNAME=$parsl.localprovider.1791979013.4708083
+process_worker_pool.py --debug  -a 127.0.0.1,192.0.2.2,vm,0 -p 0 -c 1 -m None --poll 10 --task_port=54952 --result_port=54307 --logdir=/root/package/runinfo/003/htex_local --block_id=0 --hb_period=30  --hb_threshold=120 --cpu-affinity none 
\ No newline at end of file
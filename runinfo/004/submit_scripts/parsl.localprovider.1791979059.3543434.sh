@@ -0,0 +1,3 @@
+
+export JOBNAME=$parsl.localprovider.1791979059.3543434
+process_worker_pool.py --debug --max_workers=1 -a 127.0.0.1,192.0.2.2,vm,0 -p 0 -c 1 -m None --poll 1 --task_port=54828 --result_port=54256 --logdir=/root/package/runinfo/004/htex_local --block_id=0 --hb_period=30  --hb_threshold=120 --cpu-affinity none 
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+export JOBNAME=$parsl.localprovider.1791979060.4740906
+executable_that_hopefully_does_not_exist_1030509.py
\ No newline at end of file